@@ -117,7 +117,8 @@ Angles
 ------
 The FIDUCEO MVIRI FCDR provides satellite and solar angles on a coarse tiepoint
 grid. By default these datasets will be interpolated to the higher VIS
-resolution. This can be changed as follows:
+resolution using cubic splines, as recommended by [PUG]. This can be changed
+as follows:
 
 .. code-block:: python
 
@@ -154,11 +155,15 @@ References:
 
 import abc
 import functools
+import math
 import warnings
 
+import dask
 import dask.array as da
 import numpy as np
 import xarray as xr
+from scipy.interpolate import RectBivariateSpline
+from scipy.ndimage import binary_dilation, distance_transform_edt
 
 from satpy.readers._geos_area import get_area_definition, get_area_extent, sampling_to_lfac_cfac
 from satpy.readers.file_handlers import BaseFileHandler
@@ -173,6 +178,9 @@ ALTITUDE = 42164000.0 - EQUATOR_RADIUS
 MVIRI_FIELD_OF_VIEW = 18.0
 """[Handbook] section 5.3.2.1."""
 
+CUBIC_SUPPORT = 2
+"""Number of tiepoints around invalid ones interpolated linearly."""
+
 CHANNELS = ["VIS", "WV", "IR"]
 ANGLES = [
     "solar_zenith_angle",
@@ -185,6 +193,12 @@ OTHER_REFLECTANCES = [
     "u_structured_toa_bidirectional_reflectance"
 ]
 HIGH_RESOL = 2250
+DIM_RENAMES = {
+    "y_ir_wv": "y",
+    "x_ir_wv": "x",
+    "y_tie": "y",
+    "x_tie": "x"
+}
 
 
 class IRWVCalibrator:
@@ -211,44 +225,70 @@ class IRWVCalibrator:
 
     def _calibrate_rad_bt(self, counts, calibration):
         """Calibrate counts to radiance or brightness temperature."""
-        rad = self._counts_to_radiance(counts)
         if calibration == "radiance":
-            return rad
-        bt = self._radiance_to_brightness_temperature(rad)
-        return bt
+            return self._counts_to_radiance(counts)
+        return self._counts_to_brightness_temperature(counts)
 
     def _counts_to_radiance(self, counts):
         """Convert IR/WV counts to radiance.
 
         Reference: [PUG], equations (4.1) and (4.2).
         """
-        rad = self.coefs["a"] + self.coefs["b"] * counts
+        rad = self.coefs["a"] + self.coefs["b"] * counts.astype(np.float32)
         return rad.where(rad > 0, np.float32(np.nan))
 
-    def _radiance_to_brightness_temperature(self, rad):
-        """Convert IR/WV radiance to brightness temperature.
+    def _counts_to_brightness_temperature(self, counts):
+        """Convert IR/WV counts to brightness temperature.
+
+        Radiance and brightness temperature are computed in a single kernel
+        to avoid intermediate arrays.
 
-        Reference: [PUG], equations (5.1) and (5.2).
+        Reference: [PUG], equations (4.1), (4.2), (5.1) and (5.2).
         """
-        bt = self.coefs["bt_b"] / (np.log(rad) - self.coefs["bt_a"])
-        return bt.where(bt > 0, np.float32(np.nan))
+        bt = da.map_blocks(
+            _ir_wv_bt_block,
+            counts.data,
+            a=self.coefs["a"],
+            b=self.coefs["b"],
+            bt_a=self.coefs["bt_a"],
+            bt_b=self.coefs["bt_b"],
+            dtype=np.float32
+        )
+        return counts.copy(data=bt)
+
+
+def _ir_wv_bt_block(counts, a, b, bt_a, bt_b):
+    """Compute IR/WV brightness temperature in a single pass over the given block.
+
+    All operations are done in-place on one float32 buffer.
+    """
+    buf = counts.astype(np.float32)
+    buf *= b
+    buf += a
+    buf[buf <= 0] = np.nan  # radiance
+    np.log(buf, out=buf)
+    buf -= bt_a
+    np.divide(bt_b, buf, out=buf)
+    buf[buf <= 0] = np.nan  # brightness temperature
+    return buf
 
 
 class VISCalibrator:
     """Calibrate VIS channel."""
 
-    def __init__(self, coefs, solar_zenith_angle=None):
+    def __init__(self, coefs, cos_solar_zenith_angle=None):
         """Initialize the calibrator.
 
         Args:
             coefs:
                 Calibration coefficients.
-            solar_zenith_angle (optional):
-                Solar zenith angle. Only required for calibration to
+            cos_solar_zenith_angle (optional):
+                Cosine of the solar zenith angle, NaN where there is no
+                direct illumination. Only required for calibration to
                 reflectance.
         """
         self.coefs = coefs
-        self.solar_zenith_angle = solar_zenith_angle
+        self.cos_solar_zenith_angle = cos_solar_zenith_angle
 
     def calibrate(self, counts, calibration):
         """Calibrate VIS counts."""
@@ -275,12 +315,8 @@ class VISCalibrator:
 
         Reference: [PUG], equations (7) and (8).
         """
-        years_since_launch = self.coefs["years_since_launch"]
-        a_cf = (self.coefs["a0"] +
-                self.coefs["a1"] * years_since_launch +
-                self.coefs["a2"] * years_since_launch ** 2)
         mean_count_space_vis = self.coefs["mean_count_space"]
-        rad = (counts - mean_count_space_vis) * a_cf
+        rad = (counts.astype(np.float32) - mean_count_space_vis) * self.coefs["a_cf"]
         return rad.where(rad > 0, np.float32(np.nan))
 
     def _radiance_to_reflectance(self, rad):
@@ -292,17 +328,19 @@ class VISCalibrator:
 
         Reference: [PUG], equation (6).
         """
-        sza = self.solar_zenith_angle.where(
-            da.fabs(self.solar_zenith_angle) < 90,
-            np.float32(np.nan)
-        )  # direct illumination only
-        cos_sza = np.cos(np.deg2rad(sza))
-        refl = (
-           (np.pi * self.coefs["distance_sun_earth"] ** 2) /
-           (self.coefs["solar_irradiance"] * cos_sza) *
-           rad
+        # Includes conversion from reflectance factor to percent
+        factor = np.float32(
+            100 * np.pi * self.coefs["distance_sun_earth"] ** 2 /
+            self.coefs["solar_irradiance"]
+        )
+        refl = da.map_blocks(
+            _vis_refl_block,
+            rad.data,
+            self.cos_solar_zenith_angle.data,
+            factor=factor,
+            dtype=np.float32
         )
-        return self.refl_factor_to_percent(refl)
+        return rad.copy(data=refl)
 
     def update_refl_attrs(self, refl):
         """Update attributes of reflectance datasets."""
@@ -317,6 +355,18 @@ class VISCalibrator:
         return refl * 100
 
 
+def _vis_refl_block(rad, cos_sza, factor):
+    """Compute VIS reflectance in a single pass over the given block."""
+    return (factor * rad / cos_sza).astype(np.float32, copy=False)
+
+
+def _cos_sza_block(sza):
+    """Compute cosine of the solar zenith angle (direct illumination only)."""
+    cos_sza = np.cos(np.deg2rad(sza.astype(np.float32, copy=False)))
+    cos_sza[np.abs(sza) >= 90] = np.nan
+    return cos_sza
+
+
 class Navigator:
     """Navigate MVIRI images."""
 
@@ -360,33 +410,153 @@ class Navigator:
         return lfac, cfac, loff, coff
 
 
+class TiepointSpline:
+    """Bivariate spline through a regular tiepoint grid."""
+
+    def __init__(self, tie_y, tie_x, values):
+        """Initialize the spline.
+
+        Args:
+            tie_y:
+                Tiepoint y coordinates (strictly increasing)
+            tie_x:
+                Tiepoint x coordinates (strictly increasing)
+            values:
+                Values at the tiepoints. May contain NaN.
+        """
+        self.y_range = tie_y[0], tie_y[-1]
+        self.x_range = tie_x[0], tie_x[-1]
+        self.dtype = values.dtype
+        valid = np.isfinite(values)
+        self.all_valid = bool(valid.all())
+        filled = self._fill_invalid(values, valid)
+        # Cubic spline as recommended by [PUG]. Reduce degree if there are
+        # too few tiepoints.
+        self._spline = RectBivariateSpline(
+            tie_y, tie_x, filled,
+            kx=min(3, tie_x.size - 1), ky=min(3, tie_y.size - 1)
+        )
+        if self.all_valid:
+            return
+        self._validity = RectBivariateSpline(
+            tie_y, tie_x, valid.astype(np.float64), kx=1, ky=1
+        )
+        # The cubic spline carries the error of the filled values a few
+        # tiepoints further. Fall back to linear interpolation there, which
+        # only depends on the corners of each tiepoint cell.
+        self._linear = RectBivariateSpline(tie_y, tie_x, filled, kx=1, ky=1)
+        self._near_invalid = RectBivariateSpline(
+            tie_y, tie_x, self._dilate_invalid(valid).astype(np.float64),
+            kx=1, ky=1
+        )
+
+    @staticmethod
+    def _fill_invalid(values, valid):
+        """Fill invalid tiepoints with the nearest valid value.
+
+        Otherwise NaN would spread across the entire spline.
+        """
+        if valid.all():
+            return values
+        if not valid.any():
+            return np.zeros_like(values)
+        indices = distance_transform_edt(
+            ~valid, return_distances=False, return_indices=True
+        )
+        return values[tuple(indices)]
+
+    @staticmethod
+    def _dilate_invalid(valid, size=CUBIC_SUPPORT):
+        """Extend invalid tiepoints by the given number of tiepoints."""
+        if not valid.any():
+            return ~valid
+        return binary_dilation(
+            ~valid, structure=np.ones((3, 3), dtype=bool), iterations=size
+        )
+
+    def evaluate(self, y, x):
+        """Evaluate the spline on the grid spanned by the given coordinates.
+
+        Pixels outside the tiepoint grid or next to invalid tiepoints are
+        set to NaN. Pixels within :data:`CUBIC_SUPPORT` tiepoints of invalid
+        ones are interpolated linearly.
+        """
+        y_clip = np.clip(y, *self.y_range)
+        x_clip = np.clip(x, *self.x_range)
+        res = self._spline(y_clip, x_clip)
+        outside_y = (y < self.y_range[0]) | (y > self.y_range[1])
+        outside_x = (x < self.x_range[0]) | (x > self.x_range[1])
+        invalid = outside_y[:, np.newaxis] | outside_x[np.newaxis, :]
+        if not self.all_valid:
+            near_invalid = self._near_invalid(y_clip, x_clip) > 1E-6
+            if near_invalid.any():
+                res[near_invalid] = self._linear(y_clip, x_clip)[near_invalid]
+            invalid |= self._validity(y_clip, x_clip) < 1 - 1E-6
+        res[invalid] = np.nan
+        return res.astype(self.dtype)
+
+
 class Interpolator:
     """Interpolate datasets to another resolution."""
 
     @staticmethod
-    def interp_tiepoints(ds, target_x, target_y):
-        """Interpolate dataset between tiepoints.
+    def interp_tiepoints(datasets, target_x, target_y, chunks=(CHUNK_SIZE, CHUNK_SIZE)):
+        """Interpolate datasets between tiepoints.
 
-        Uses linear interpolation.
+        Uses cubic spline interpolation as recommended by [PUG]. Splines
+        are fitted to the (small) tiepoint grid at once and evaluated lazily
+        on the target grid.
 
-        FUTURE: [PUG] recommends cubic spline interpolation.
+        All datasets must share the same tiepoint grid. Tiepoint values are
+        read in a single dask computation and tiepoint coordinates and
+        target grid are set up only once.
 
         Args:
-            ds:
-                Dataset to be interpolated
+            datasets:
+                Mapping of names to datasets to be interpolated
             target_x:
                 Target x coordinates
             target_y:
                 Target y coordinates
+            chunks:
+                Dask chunks of the interpolated datasets in x and y
+                direction. Should match the image data.
+
+        Returns:
+            Mapping of names to interpolated datasets
         """
+        if not datasets:
+            return {}
         # No tiepoint coordinates specified in the files. Use dimensions
         # to calculate tiepoint sampling and assign tiepoint coordinates
         # accordingly.
-        sampling = target_x.size // ds.coords["x"].size
-        ds = ds.assign_coords(x=target_x.values[::sampling],
-                              y=target_y.values[::sampling])
-
-        return ds.interp(x=target_x.values, y=target_y.values)
+        tie_size = next(iter(datasets.values())).sizes["x"]
+        sampling = target_x.size // tie_size
+        tie_y = target_y.data[::sampling]
+        tie_x = target_x.data[::sampling]
+        x_chunks, y_chunks = chunks
+        target_y_dask = da.from_array(target_y.data, chunks=(y_chunks,))
+        target_x_dask = da.from_array(target_x.data, chunks=(x_chunks,))
+        coords = {"y": target_y.data, "x": target_x.data}
+
+        tie_values = dask.compute(*[ds.data for ds in datasets.values()])
+        res = {}
+        for (name, ds), values in zip(datasets.items(), tie_values):
+            spline = TiepointSpline(tie_y, tie_x, np.asarray(values))
+            interp = da.blockwise(
+                spline.evaluate, "yx",
+                target_y_dask, "y",
+                target_x_dask, "x",
+                dtype=spline.dtype
+            )
+            res[name] = xr.DataArray(
+                interp,
+                dims=("y", "x"),
+                coords=coords,
+                attrs=ds.attrs,
+                name=ds.name
+            )
+        return res
 
     @staticmethod
     def interp_acq_time(time2d, target_y):
@@ -410,13 +580,15 @@ class Interpolator:
 
         # If required, repeat timestamps in y-direction to obtain higher
         # resolution
-        y = time.coords["y"].values
-        if y.size < target_y.size:
-            reps = target_y.size // y.size
-            y_rep = np.repeat(y, reps)
-            time_hires = time.reindex(y=y_rep)
-            time_hires = time_hires.assign_coords(y=target_y)
-            return time_hires
+        if time.sizes["y"] < target_y.size:
+            reps = target_y.size // time.sizes["y"]
+            return xr.DataArray(
+                da.repeat(da.asarray(time.data), reps, axis=0),
+                dims=("y",),
+                coords={"y": target_y.data},
+                attrs=time.attrs,
+                name=time.name
+            )
         return time
 
 
@@ -429,8 +601,7 @@ class VisQualityControl:
 
     def check(self):
         """Check VIS channel quality and issue a warning if it's bad."""
-        use_with_caution = da.bitwise_and(self._mask, 2)
-        if use_with_caution.all():
+        if self._all_use_with_caution():
             warnings.warn(
                 'All pixels of the VIS channel are flagged as "use with '
                 'caution". Use datasets "quality_pixel_bitmask" and '
@@ -438,13 +609,63 @@ class VisQualityControl:
                 stacklevel=2
             )
 
+    def _all_use_with_caution(self):
+        """Check whether all pixels are flagged as "use with caution".
+
+        Chunks are checked one after another, stopping at the first pixel
+        without that flag. In the common case of good quality only the
+        first chunk has to be read.
+        """
+        blocks = da.asarray(self._mask.data).to_delayed().ravel()
+        for block in blocks:
+            if not dask.delayed(_is_flag_set_everywhere)(block, 2).compute():
+                return False
+        return True
+
     def mask(self, ds):
         """Mask VIS pixels with bad quality.
 
         Pixels are considered bad quality if the "quality_pixel_bitmask" is
         everything else than 0 (no flag set).
         """
-        return ds.where(self._mask == 0, np.float32(np.nan))
+        dtype = np.result_type(ds.dtype, np.float32)
+        return xr.apply_ufunc(
+            _mask_block,
+            ds,
+            self._mask,
+            kwargs={"dtype": dtype},
+            dask="parallelized",
+            output_dtypes=[dtype],
+            keep_attrs=True
+        )
+
+
+def _is_flag_set_everywhere(mask, flag):
+    """Check whether the given flag is set in all pixels of a bitmask block.
+
+    The 8 bit mask is viewed as 64 bit words, so that 8 pixels are tested
+    at once. Remaining pixels at the end are tested individually.
+    """
+    mask = np.ascontiguousarray(mask, dtype=np.uint8).ravel()
+    num_words = mask.size // 8
+    words = mask[:num_words * 8].view(np.uint64)
+    word_flag = np.uint64(int.from_bytes(bytes([flag] * 8), "little"))
+    if not np.all((words & word_flag) == word_flag):
+        return False
+    tail = mask[num_words * 8:]
+    return bool(np.all((tail & flag) == flag))
+
+
+def _mask_block(data, mask, dtype):
+    """Set pixels with any quality flag to NaN in a single pass."""
+    masked = data.astype(dtype)
+    masked[mask != 0] = np.nan
+    return masked
+
+
+def _get_aligned_chunk_size(disk_chunk_size):
+    """Get largest multiple of the on-disk chunk size not exceeding CHUNK_SIZE."""
+    return max(CHUNK_SIZE // disk_chunk_size, 1) * disk_chunk_size
 
 
 def is_high_resol(resolution):
@@ -459,37 +680,73 @@ class DatasetWrapper:
         """Wrap the given dataset."""
         self.nc = nc
 
+    @property
+    def nc(self):
+        """Wrapped dataset, without CF decoding."""
+        return self._nc
+
+    @nc.setter
+    def nc(self, nc):
+        """Set the wrapped dataset and reset the variable cache."""
+        self._nc = nc
+        self._cache = {}
+        self._dim_renames = self._get_dim_renames(nc)
+
     @property
     def attrs(self):
         """Exposes dataset attributes."""
         return self.nc.attrs
 
     def __getitem__(self, item):
-        """Get a variable from the dataset."""
-        ds = self.nc[item]
-        if self._should_dims_be_renamed(ds):
-            ds = self._rename_dims(ds)
+        """Get a variable from the dataset.
+
+        Variables are prepared only once and cached. Callers get a shallow
+        copy, so that modifying attributes or coordinates cannot alter the
+        cache. The data stays lazy.
+        """
+        if item not in self._cache:
+            self._cache[item] = self._get_variable(item)
+        return self._cache[item].copy(deep=False)
+
+    def __contains__(self, item):
+        """Check whether the dataset contains the given variable."""
+        return item in self.nc
+
+    def _get_variable(self, item):
+        """Get a variable from the dataset and prepare it for satpy."""
+        ds = self._decode(item)
+        dim_renames = self._dim_renames.get(item)
+        if dim_renames:
+            ds = ds.rename(dim_renames)
         elif self._coordinates_not_assigned(ds):
             ds = self._reassign_coords(ds)
         self._cleanup_attrs(ds)
         return ds
 
-    def _should_dims_be_renamed(self, ds):
-        """Determine whether dataset dimensions need to be renamed."""
-        return "y_ir_wv" in ds.dims or "y_tie" in ds.dims
-
-    def _rename_dims(self, ds):
-        """Rename dataset dimensions to match satpy's expectations."""
-        new_names = {
-            "y_ir_wv": "y",
-            "x_ir_wv": "x",
-            "y_tie": "y",
-            "x_tie": "x"
-        }
-        for old_name, new_name in new_names.items():
-            if old_name in ds.dims:
-                ds = ds.rename({old_name: new_name})
-        return ds
+    def _decode(self, item):
+        """Apply CF decoding to the given variable.
+
+        The dataset is opened without decoding, so that only variables
+        actually read are decoded.
+        """
+        ds = self.nc[item]
+        return xr.decode_cf(ds.to_dataset(name=item))[item]
+
+    @staticmethod
+    def _get_dim_renames(nc):
+        """Determine which dimensions need to be renamed for each variable.
+
+        Dimensions are renamed to match satpy's expectations. Variables
+        without such dimensions are omitted.
+        """
+        dim_renames = {}
+        for name, var in nc.variables.items():
+            renames = {old_name: new_name
+                       for old_name, new_name in DIM_RENAMES.items()
+                       if old_name in var.dims}
+            if renames:
+                dim_renames[name] = renames
+        return dim_renames
 
     def _coordinates_not_assigned(self, ds):
         return "y" in ds.dims and "y" not in ds.coords
@@ -509,6 +766,15 @@ class DatasetWrapper:
         # satpy warnings.
         ds.attrs.pop("ancillary_variables", None)
 
+    def get_scalars(self, names):
+        """Get values of the given scalar variables.
+
+        All variables are computed at once instead of triggering one dask
+        computation per variable.
+        """
+        variables = dask.compute(*[self[name] for name in names])
+        return [var.item() for var in variables]
+
     def get_time(self):
         """Get time coordinate.
 
@@ -525,6 +791,15 @@ class DatasetWrapper:
             return self.nc.coords["x"], self.nc.coords["y"]
         return self.nc.coords["x_ir_wv"], self.nc.coords["x_ir_wv"]
 
+    def get_xy_chunks(self, resolution):
+        """Get dask chunks of the image data in x and y direction."""
+        if is_high_resol(resolution):
+            x_dim, y_dim = "x", "y"
+        else:
+            x_dim, y_dim = "x_ir_wv", "y_ir_wv"
+        chunks = self.nc.chunks
+        return chunks.get(x_dim, CHUNK_SIZE), chunks.get(y_dim, CHUNK_SIZE)
+
     def get_image_size(self, resolution):
         """Get image size for the given resolution."""
         if is_high_resol(resolution):
@@ -553,13 +828,12 @@ class FiduceoMviriBase(BaseFileHandler):
         super(FiduceoMviriBase, self).__init__(
             filename, filename_info, filetype_info)
         self.mask_bad_quality = mask_bad_quality
+        # Apply CF decoding only to the variables actually read, see
+        # DatasetWrapper.
         nc_raw = xr.open_dataset(
-            filename,
-            chunks={"x": CHUNK_SIZE,
-                    "y": CHUNK_SIZE,
-                    "x_ir_wv": CHUNK_SIZE,
-                    "y_ir_wv": CHUNK_SIZE}
+            filename, chunks=None, decode_cf=False, mask_and_scale=False
         )
+        nc_raw = nc_raw.chunk(self._get_chunks(nc_raw))
         self.nc = DatasetWrapper(nc_raw)
 
         # Projection longitude is not provided in the file, read it from the
@@ -567,12 +841,44 @@ class FiduceoMviriBase(BaseFileHandler):
         self.projection_longitude = float(filename_info["projection_longitude"])
         self.calib_coefs = self._get_calib_coefs()
 
-        self._get_angles = functools.lru_cache(maxsize=8)(
-            self._get_angles_uncached
+        self._get_all_angles = functools.lru_cache(maxsize=2)(
+            self._get_all_angles_uncached
         )
         self._get_acq_time = functools.lru_cache(maxsize=3)(
             self._get_acq_time_uncached
         )
+        self._get_area_def = functools.lru_cache(maxsize=2)(
+            self._get_area_def_uncached
+        )
+        self._get_orbital_parameters = functools.lru_cache(maxsize=1)(
+            self._get_orbital_parameters_uncached
+        )
+
+    def _get_chunks(self, nc_raw):
+        """Get dask chunks aligned with the on-disk chunks.
+
+        Use the largest multiple of the on-disk chunk size not exceeding
+        ``CHUNK_SIZE``, so that each dask chunk reads whole stored chunks
+        only. Fall back to ``CHUNK_SIZE`` if the file doesn't provide
+        chunking information. Dimensions not present in the file are
+        omitted.
+        """
+        chunks = {"x": CHUNK_SIZE,
+                  "y": CHUNK_SIZE,
+                  "x_ir_wv": CHUNK_SIZE,
+                  "y_ir_wv": CHUNK_SIZE}
+        for nc_key in self.nc_keys.values():
+            try:
+                var = nc_raw[nc_key]
+            except KeyError:
+                continue
+            disk_chunks = var.encoding.get("chunksizes")
+            if not disk_chunks:
+                continue
+            for dim, disk_chunk_size in zip(var.dims, disk_chunks):
+                chunks[dim] = _get_aligned_chunk_size(disk_chunk_size)
+        return {dim: size for dim, size in chunks.items()
+                if dim in nc_raw.dims}
 
     def get_dataset(self, dataset_id, dataset_info):
         """Get the dataset."""
@@ -590,7 +896,11 @@ class FiduceoMviriBase(BaseFileHandler):
 
     def get_area_def(self, dataset_id):
         """Get area definition of the given dataset."""
-        im_size = self.nc.get_image_size(dataset_id["resolution"])
+        return self._get_area_def(dataset_id["resolution"])
+
+    def _get_area_def_uncached(self, resolution):
+        """Get area definition for the given resolution."""
+        im_size = self.nc.get_image_size(resolution)
         nav = Navigator()
         return nav.get_area_def(
             im_size=im_size,
@@ -614,18 +924,24 @@ class FiduceoMviriBase(BaseFileHandler):
         ds["acq_time"] = self._get_acq_time(resolution)
         return ds
 
-    def _get_angles_uncached(self, name, resolution):
-        """Get angle dataset.
+    def _get_angles(self, name, resolution):
+        """Get angle dataset."""
+        return self._get_all_angles(resolution)[name]
+
+    def _get_all_angles_uncached(self, resolution):
+        """Get all angle datasets.
 
         Files provide angles (solar/satellite zenith & azimuth) at a coarser
-        resolution. Interpolate them to the desired resolution.
+        resolution. Interpolate them to the desired resolution. All angles
+        share the same tiepoints, so interpolate them together.
         """
-        angles = self.nc[name]
+        angles = {name: self.nc[name] for name in ANGLES if name in self.nc}
         target_x, target_y = self.nc.get_xy_coords(resolution)
         return Interpolator.interp_tiepoints(
             angles,
             target_x=target_x,
-            target_y=target_y
+            target_y=target_y,
+            chunks=self.nc.get_xy_chunks(resolution)
         )
 
     def _get_other_dataset(self, name):
@@ -641,7 +957,7 @@ class FiduceoMviriBase(BaseFileHandler):
         ds.attrs.update({"platform": self.filename_info["platform"],
                          "sensor": self.filename_info["sensor"]})
         ds.attrs["raw_metadata"] = self.nc.attrs
-        ds.attrs["orbital_parameters"] = self._get_orbital_parameters()
+        ds.attrs["orbital_parameters"] = self._get_orbital_parameters().copy()
 
     def _cleanup_coords(self, ds):
         """Cleanup dataset coordinates.
@@ -668,35 +984,48 @@ class FiduceoMviriBase(BaseFileHandler):
     def _get_calib_coefs(self):
         """Get calibration coefficients for all channels.
 
+        Coefficients are read from the file in a single dask computation
+        and stored as plain scalars, so that they enter the dask graphs of
+        calibrated data as constants.
+        """
+        coef_nc_keys = self._get_calib_coef_nc_keys()
+        nc_keys = [nc_key
+                   for ch in coef_nc_keys
+                   for nc_key in coef_nc_keys[ch].values()]
+        values = dict(zip(nc_keys, self.nc.get_scalars(nc_keys)))
+
+        # Convert coefficients to 32bit float to reduce memory footprint
+        # of calibrated data.
+        return {
+            ch: {name: np.float32(values[nc_key])
+                 for name, nc_key in coef_nc_keys[ch].items()}
+            for ch in coef_nc_keys
+        }
+
+    def _get_calib_coef_nc_keys(self):
+        """Get netCDF variable names of calibration coefficients.
+
         Note: Only coefficients present in both file types.
         """
-        coefs = {
+        return {
             "VIS": {
-                "distance_sun_earth": self.nc["distance_sun_earth"],
-                "solar_irradiance": self.nc["solar_irradiance_vis"]
+                "distance_sun_earth": "distance_sun_earth",
+                "solar_irradiance": "solar_irradiance_vis"
             },
             "IR": {
-                "a": self.nc["a_ir"],
-                "b": self.nc["b_ir"],
-                "bt_a": self.nc["bt_a_ir"],
-                "bt_b": self.nc["bt_b_ir"]
+                "a": "a_ir",
+                "b": "b_ir",
+                "bt_a": "bt_a_ir",
+                "bt_b": "bt_b_ir"
             },
             "WV": {
-                "a": self.nc["a_wv"],
-                "b": self.nc["b_wv"],
-                "bt_a": self.nc["bt_a_wv"],
-                "bt_b": self.nc["bt_b_wv"]
+                "a": "a_wv",
+                "b": "b_wv",
+                "bt_a": "bt_a_wv",
+                "bt_b": "bt_b_wv"
             },
         }
 
-        # Convert coefficients to 32bit float to reduce memory footprint
-        # of calibrated data.
-        for ch in coefs:
-            for name in coefs[ch]:
-                coefs[ch][name] = np.float32(coefs[ch][name])
-
-        return coefs
-
     def _get_acq_time_uncached(self, resolution):
         """Get scanline acquisition time for the given resolution.
 
@@ -705,9 +1034,9 @@ class FiduceoMviriBase(BaseFileHandler):
         """
         time2d = self.nc.get_time()
         _, target_y = self.nc.get_xy_coords(resolution)
-        return Interpolator.interp_acq_time(time2d, target_y=target_y.values)
+        return Interpolator.interp_acq_time(time2d, target_y=target_y)
 
-    def _get_orbital_parameters(self):
+    def _get_orbital_parameters_uncached(self):
         """Get the orbital parameters."""
         orbital_parameters = {
             "projection_longitude": self.projection_longitude,
@@ -741,14 +1070,15 @@ class FiduceoMviriBase(BaseFileHandler):
         key_start = "sub_satellite_{}_start".format(coord)
         key_end = "sub_satellite_{}_end".format(coord)
         try:
-            sub_lonlat = np.nanmean(
-                [self.nc[key_start].values,
-                 self.nc[key_end].values]
-            )
+            start, end = self.nc.get_scalars([key_start, key_end])
         except KeyError:
             # Variables seem to be missing in full FCDR
-            sub_lonlat = np.nan
-        return sub_lonlat
+            return np.nan
+        if math.isnan(start):
+            return end
+        if math.isnan(end):
+            return start
+        return (start + end) / 2
 
 
 class FiduceoMviriEasyFcdrFileHandler(FiduceoMviriBase):
@@ -781,24 +1111,52 @@ class FiduceoMviriFullFcdrFileHandler(FiduceoMviriBase):
     nc_keys = FiduceoMviriBase.nc_keys.copy()
     nc_keys["VIS"] = "count_vis"
 
-    def _get_calib_coefs(self):
+    def __init__(self, *args, **kwargs):
+        """Initialize the file handler."""
+        super().__init__(*args, **kwargs)
+        self._get_cos_sza = functools.lru_cache(maxsize=1)(
+            self._get_cos_sza_uncached
+        )
+
+    def _get_calib_coef_nc_keys(self):
         """Add additional VIS coefficients only present in full FCDR."""
-        coefs = super()._get_calib_coefs()
-        coefs["VIS"].update({
-            "years_since_launch": np.float32(self.nc["years_since_launch"]),
-            "a0": np.float32(self.nc["a0_vis"]),
-            "a1": np.float32(self.nc["a1_vis"]),
-            "a2": np.float32(self.nc["a2_vis"]),
-            "mean_count_space": np.float32(
-                self.nc["mean_count_space_vis"]
-            )
+        nc_keys = super()._get_calib_coef_nc_keys()
+        nc_keys["VIS"].update({
+            "years_since_launch": "years_since_launch",
+            "a0": "a0_vis",
+            "a1": "a1_vis",
+            "a2": "a2_vis",
+            "mean_count_space": "mean_count_space_vis"
         })
+        return nc_keys
+
+    def _get_calib_coefs(self):
+        """Add VIS calibration slope.
+
+        The slope only depends on scalar coefficients, so compute it once
+        per file instead of on every VIS calibration.
+        """
+        coefs = super()._get_calib_coefs()
+        vis = coefs["VIS"]
+        years = vis["years_since_launch"]
+        # Horner scheme of a0 + a1 * years + a2 * years ** 2
+        vis["a_cf"] = np.float32(vis["a0"] + years * (vis["a1"] + years * vis["a2"]))
         return coefs
 
     def _calibrate_vis(self, ds, channel, calibration):
         """Calibrate VIS channel."""
-        sza = None
+        cos_sza = None
         if calibration == "reflectance":
-            sza = self._get_angles("solar_zenith_angle", HIGH_RESOL)
-        cal = VISCalibrator(self.calib_coefs[channel], sza)
+            cos_sza = self._get_cos_sza()
+        cal = VISCalibrator(self.calib_coefs[channel], cos_sza)
         return cal.calibrate(ds, calibration)
+
+    def _get_cos_sza_uncached(self):
+        """Get cosine of the solar zenith angle at VIS resolution.
+
+        VIS reflectance is the only consumer, so compute it once per file.
+        The interpolated solar zenith angle is shared with angle queries.
+        """
+        sza = self._get_angles("solar_zenith_angle", HIGH_RESOL)
+        cos_sza = da.map_blocks(_cos_sza_block, sza.data, dtype=np.float32)
+        return sza.copy(data=cos_sza)
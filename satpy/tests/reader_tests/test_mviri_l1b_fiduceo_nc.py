@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import os
+import warnings
 from unittest import mock
 
 import dask.array as da
@@ -36,6 +37,10 @@ from satpy.readers.mviri_l1b_fiduceo_nc import (
     DatasetWrapper,
     FiduceoMviriEasyFcdrFileHandler,
     FiduceoMviriFullFcdrFileHandler,
+    Interpolator,
+    IRWVCalibrator,
+    VISCalibrator,
+    VisQualityControl,
 )
 from satpy.tests.utils import make_dataid
 
@@ -364,6 +369,32 @@ class TestFiduceoMviriFileHandlers:
         assert file_handler.projection_longitude == 57.0
         assert file_handler.mask_bad_quality is True
 
+    @mock.patch("satpy.readers.mviri_l1b_fiduceo_nc.CHUNK_SIZE", 3)
+    def test_chunks_aligned_with_disk_chunks(self, fake_dataset):
+        """Test that dask chunks are aligned with the on-disk chunks."""
+        fake_dataset["count_vis"].encoding["chunksizes"] = (2, 2)
+        with mock.patch("satpy.readers.mviri_l1b_fiduceo_nc.xr.open_dataset") as open_dataset:
+            open_dataset.return_value = fake_dataset
+            file_handler = FiduceoMviriFullFcdrFileHandler(
+                filename="filename",
+                filename_info={"platform": "MET7",
+                               "sensor": "MVIRI",
+                               "projection_longitude": "57.0"},
+                filetype_info={"foo": "bar"}
+            )
+        assert file_handler.nc.nc["count_vis"].chunks == ((2, 2), (2, 2))
+        # No chunking information available, fall back to CHUNK_SIZE
+        assert file_handler.nc.nc["count_ir"].chunks == ((2,), (2,))
+
+    def test_chunks_missing_dims(self, file_handler):
+        """Test that chunks are only given for dimensions in the file."""
+        nc_raw = xr.Dataset(
+            {"count_vis": (("y", "x"), np.zeros((4, 4), dtype=np.uint8))}
+        )
+        chunks = file_handler._get_chunks(nc_raw)
+        assert chunks.keys() == {"y", "x"}
+        assert nc_raw.chunk(chunks)["count_vis"].chunks is not None
+
     @pytest.mark.parametrize(
         ("name", "calibration", "resolution", "expected"),
         [
@@ -482,6 +513,29 @@ class TestFiduceoMviriFileHandlers:
         file_handler.get_dataset(another_id, info)
         interp_tiepoints.assert_called()
 
+    @pytest.mark.parametrize(
+        "file_handler", [FiduceoMviriFullFcdrFileHandler], indirect=True
+    )
+    def test_cos_sza_cache(self, file_handler):
+        """Test caching of the cosine of the solar zenith angle."""
+        dataset_id = make_dataid(
+            name="VIS",
+            resolution=2250,
+            calibration="reflectance"
+        )
+        info = {}
+        with mock.patch.object(
+                file_handler, "_get_angles", wraps=file_handler._get_angles
+        ) as get_angles:
+            # Cache init
+            file_handler.get_dataset(dataset_id, info)
+            get_angles.assert_called_once_with("solar_zenith_angle", 2250)
+
+            # Cache hit
+            get_angles.reset_mock()
+            file_handler.get_dataset(dataset_id, info)
+            get_angles.assert_not_called()
+
     @pytest.mark.parametrize(
         ("name", "resolution", "area_exp"),
         [
@@ -502,6 +556,26 @@ class TestFiduceoMviriFileHandlers:
         assert area.crs == area_exp.crs
         np.testing.assert_allclose(area.area_extent, area_exp.area_extent)
 
+    @mock.patch(
+        "satpy.readers.mviri_l1b_fiduceo_nc.Navigator.get_area_def"
+    )
+    def test_area_def_cache(self, get_area_def, file_handler):
+        """Test caching of area definitions."""
+        # Cache init
+        file_handler.get_area_def(make_dataid(name="VIS", resolution=2250))
+        get_area_def.assert_called()
+
+        # Cache hit
+        get_area_def.reset_mock()
+        file_handler.get_area_def(
+            make_dataid(name="solar_zenith_angle", resolution=2250)
+        )
+        get_area_def.assert_not_called()
+
+        # Cache miss
+        file_handler.get_area_def(make_dataid(name="IR", resolution=4500))
+        get_area_def.assert_called()
+
     def test_calib_exceptions(self, file_handler):
         """Test calibration exceptions."""
         with pytest.raises(KeyError):
@@ -555,6 +629,73 @@ class TestFiduceoMviriFileHandlers:
         assert len(files) == 3
 
 
+class TestCalibrators:
+    """Unit tests for IR/WV and VIS calibrators."""
+
+    @staticmethod
+    def _get_counts(dtype, **kwargs):
+        """Get counts with the given dtype."""
+        return xr.DataArray(
+            da.from_array(np.array([[0, 85], [170, 255]], dtype=dtype)),
+            dims=("y", "x"),
+            **kwargs
+        )
+
+    @staticmethod
+    def _get_vis_calibrator():
+        """Get VIS calibrator."""
+        coefs = {"a_cf": np.float32(1.16), "mean_count_space": np.float32(1),
+                 "distance_sun_earth": np.float32(1),
+                 "solar_irradiance": np.float32(650)}
+        cos_sza = xr.DataArray(
+            da.from_array(np.array([[0.5, 0.6], [0.7, np.nan]])),
+            dims=("y", "x")
+        )
+        return VISCalibrator(coefs, cos_sza)
+
+    @pytest.mark.parametrize("counts_dtype", [np.uint8, np.float64])
+    @pytest.mark.parametrize("calibration", ["radiance", "brightness_temperature"])
+    def test_ir_wv_float32(self, counts_dtype, calibration):
+        """Test that IR/WV calibration doesn't upcast to 64 bit float."""
+        coefs = {"a": np.float32(-5), "b": np.float32(1),
+                 "bt_a": np.float32(10), "bt_b": np.float32(-1000)}
+        calib = IRWVCalibrator(coefs)
+        res = calib.calibrate(self._get_counts(counts_dtype), calibration)
+        assert res.dtype == np.float32
+        assert res.compute().dtype == np.float32
+
+    @pytest.mark.parametrize("calibration", ["radiance", "brightness_temperature"])
+    def test_ir_wv_name_attrs(self, calibration):
+        """Test that IR/WV calibration keeps name and attributes."""
+        coefs = {"a": np.float32(-5), "b": np.float32(1),
+                 "bt_a": np.float32(10), "bt_b": np.float32(-1000)}
+        calib = IRWVCalibrator(coefs)
+        counts = self._get_counts(np.uint8, name="count_ir",
+                                  attrs={"long_name": "IR counts"})
+        res = calib.calibrate(counts, calibration)
+        assert res.name == "count_ir"
+        assert res.attrs["long_name"] == "IR counts"
+
+    @pytest.mark.parametrize("counts_dtype", [np.uint8, np.float64])
+    @pytest.mark.parametrize("calibration", ["radiance", "reflectance"])
+    def test_vis_float32(self, counts_dtype, calibration):
+        """Test that VIS calibration doesn't upcast to 64 bit float."""
+        calib = self._get_vis_calibrator()
+        res = calib.calibrate(self._get_counts(counts_dtype), calibration)
+        assert res.dtype == np.float32
+        assert res.compute().dtype == np.float32
+
+    @pytest.mark.parametrize("calibration", ["radiance", "reflectance"])
+    def test_vis_name_attrs(self, calibration):
+        """Test that VIS calibration keeps name and attributes."""
+        calib = self._get_vis_calibrator()
+        counts = self._get_counts(np.uint8, name="count_vis",
+                                  attrs={"long_name": "VIS counts"})
+        res = calib.calibrate(counts, calibration)
+        assert res.name == "count_vis"
+        assert res.attrs["long_name"] == "VIS counts"
+
+
 class TestDatasetWrapper:
     """Unit tests for DatasetWrapper class."""
 
@@ -591,3 +732,200 @@ class TestDatasetWrapper:
         ds = DatasetWrapper(nc)
         foo = ds["foo"]
         xr.testing.assert_equal(foo, foo_exp)
+
+    def test_variable_cache(self):
+        """Test caching of variables."""
+        foo_raw = xr.DataArray(
+            [[1, 2],
+             [3, 4]],
+            dims=("y_ir_wv", "x_ir_wv"),
+            attrs={"ancillary_variables": "a b"}
+        )
+        nc = mock.MagicMock(variables={"foo": foo_raw})
+        nc.__getitem__.return_value = foo_raw
+        ds = DatasetWrapper(nc)
+
+        # Cache init
+        foo = ds["foo"]
+        foo.attrs["bar"] = "baz"
+        nc.__getitem__.assert_called_once_with("foo")
+        assert foo.dims == ("y", "x")
+
+        # Cache hit. Modifications of previous results must not leak.
+        nc.__getitem__.reset_mock()
+        foo = ds["foo"]
+        nc.__getitem__.assert_not_called()
+        assert foo.attrs == {}
+
+    def test_decode(self):
+        """Test CF decoding of variables read from the raw dataset."""
+        nc = xr.Dataset(
+            {
+                "count_ir": (
+                    ("y_ir_wv", "x_ir_wv"),
+                    np.array([[1, 255], [3, 4]], dtype=np.uint8),
+                    {"_FillValue": 255}
+                ),
+                "solar_zenith_angle": (
+                    ("y_tie", "x_tie"),
+                    np.array([[100, -32768], [300, 400]], dtype=np.int16),
+                    {"_FillValue": -32768, "scale_factor": np.float32(0.01)}
+                ),
+                "time_ir_wv": (
+                    ("y_ir_wv", "x_ir_wv"),
+                    np.array([[0, 60], [120, -2147483648]], dtype=np.int32),
+                    {"_FillValue": -2147483648,
+                     "units": "seconds since 1970-01-01 00:00:00"}
+                )
+            }
+        )
+        ds = DatasetWrapper(nc)
+
+        count_ir = ds["count_ir"]
+        assert count_ir.dims == ("y", "x")
+        assert count_ir.dtype == np.float32
+        np.testing.assert_equal(count_ir.values, [[1, np.nan], [3, 4]])
+
+        sza = ds["solar_zenith_angle"]
+        assert sza.dims == ("y", "x")
+        assert sza.dtype == np.float32
+        np.testing.assert_allclose(sza.values, [[1, np.nan], [3, 4]])
+
+        time_ir_wv = ds["time_ir_wv"]
+        assert time_ir_wv.dtype.kind == "M"
+        np.testing.assert_equal(
+            time_ir_wv.values,
+            np.array([["1970-01-01T00:00:00", "1970-01-01T00:01:00"],
+                      ["1970-01-01T00:02:00", "NaT"]],
+                     dtype="datetime64[ns]")
+        )
+
+
+class TestInterpolator:
+    """Unit tests for Interpolator class."""
+
+    @staticmethod
+    def _poly(y, x):
+        """Cubic polynomial to be reproduced by the spline."""
+        return 0.01 * y ** 3 + x ** 2 - y * x
+
+    def test_interp_tiepoints(self):
+        """Test cubic spline interpolation of multiple datasets."""
+        tie_coords = np.array([1, 3, 5, 7])
+        tie_y, tie_x = np.meshgrid(tie_coords, tie_coords, indexing="ij")
+        tie_values = self._poly(tie_y, tie_x).astype(np.float32)
+        tiepoints = {
+            "foo": xr.DataArray(
+                da.from_array(tie_values),
+                dims=("y", "x"),
+                coords={"y": tie_coords, "x": tie_coords}
+            ),
+            "bar": xr.DataArray(
+                -tie_values,
+                dims=("y", "x"),
+                coords={"y": tie_coords, "x": tie_coords}
+            )
+        }
+        target = np.arange(1, 9)
+        target_y, target_x = np.meshgrid(target, target, indexing="ij")
+        expected = self._poly(target_y, target_x)
+        expected[-1, :] = np.nan  # outside of tiepoint grid
+        expected[:, -1] = np.nan
+
+        res = Interpolator.interp_tiepoints(
+            tiepoints,
+            target_x=xr.DataArray(target, dims="x"),
+            target_y=xr.DataArray(target, dims="y"),
+            chunks=(3, 3)
+        )
+
+        assert res.keys() == {"foo", "bar"}
+        for name, sign in [("foo", 1), ("bar", -1)]:
+            assert isinstance(res[name].data, da.Array)
+            assert res[name].chunks == ((3, 3, 2), (3, 3, 2))
+            assert res[name].dtype == np.float32
+            np.testing.assert_allclose(res[name].values, sign * expected,
+                                       rtol=1E-5, atol=1E-4)
+
+    def test_interp_tiepoints_invalid(self):
+        """Test that invalid tiepoints only affect their neighbourhood."""
+        tie_coords = np.array([1, 3, 5, 7])
+        tiepoints = xr.DataArray(
+            np.ones((4, 4), dtype=np.float32),
+            dims=("y", "x"),
+            coords={"y": tie_coords, "x": tie_coords}
+        )
+        tiepoints[0, 0] = np.nan
+        target = np.arange(1, 9)
+
+        res = Interpolator.interp_tiepoints(
+            {"foo": tiepoints},
+            target_x=xr.DataArray(target, dims="x"),
+            target_y=xr.DataArray(target, dims="y")
+        )["foo"].values
+
+        assert np.isnan(res[:2, :2]).all()
+        assert np.isnan(res[-1, :]).all()  # outside of tiepoint grid
+        assert np.isnan(res[:, -1]).all()
+        np.testing.assert_allclose(res[2:-1, :-1], 1)
+        np.testing.assert_allclose(res[:-1, 2:-1], 1)
+
+    def test_interp_tiepoints_invalid_neighbourhood(self):
+        """Test that filled invalid tiepoints don't leak into valid pixels."""
+        tie_coords = np.arange(1, 20, 2)
+        tie_y, tie_x = np.meshgrid(tie_coords, tie_coords, indexing="ij")
+        tie_values = (0.5 * tie_y + 0.3 * tie_x + 10).astype(np.float32)
+        tie_values[:2, :2] = np.nan
+        tiepoints = xr.DataArray(
+            tie_values,
+            dims=("y", "x"),
+            coords={"y": tie_coords, "x": tie_coords}
+        )
+        target = np.arange(1, 21)
+        target_y, target_x = np.meshgrid(target, target, indexing="ij")
+        expected = 0.5 * target_y + 0.3 * target_x + 10
+        expected[:4, :4] = np.nan  # next to invalid tiepoints
+        expected[-1, :] = np.nan  # outside of tiepoint grid
+        expected[:, -1] = np.nan
+
+        res = Interpolator.interp_tiepoints(
+            {"foo": tiepoints},
+            target_x=xr.DataArray(target, dims="x"),
+            target_y=xr.DataArray(target, dims="y")
+        )["foo"].values
+
+        # Valid pixels within the cubic support of the invalid tiepoints
+        # must be exact, further away the spline reproduces the linear
+        # field up to the remaining influence of the filled values.
+        np.testing.assert_allclose(res[:8, :8], expected[:8, :8],
+                                   rtol=1E-6)
+        np.testing.assert_allclose(res, expected, rtol=1E-3)
+
+
+class TestVisQualityControl:
+    """Unit tests for VisQualityControl class."""
+
+    @pytest.mark.parametrize(
+        ("clean_pixel", "warns"),
+        [
+            (None, True),
+            ((0, 0), False),
+            ((7, 6), False),
+            ((9, 9), False)
+        ]
+    )
+    def test_check(self, clean_pixel, warns):
+        """Test checking VIS quality across multiple chunks."""
+        mask = np.full((10, 10), 3, dtype=np.uint8)
+        if clean_pixel:
+            mask[clean_pixel] = 1
+        qc = VisQualityControl(
+            xr.DataArray(da.from_array(mask, chunks=5), dims=("y", "x"))
+        )
+        if warns:
+            with pytest.warns(UserWarning, match="use with caution"):
+                qc.check()
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                qc.check()